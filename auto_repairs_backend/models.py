@@ -89,10 +89,10 @@ class User(AbstractUser):
 
     def get_accessible_shops(self):
         """Get shops this user can access"""
-        if self.is_owner:
-            from shop.models import Shop
+        from shop.models import Shop
 
+        if self.is_owner:
             return Shop.objects.all()
-        elif self.is_employee and hasattr(self, "employee_profile"):  # type: ignore
-            return [self.employee_profile.shop]  # type: ignore
-        return []
+        elif self.is_employee:
+            return Shop.objects.filter(employees__user=self)
+        return Shop.objects.none()
@@ -0,0 +1,33 @@
+"""
+Settings for running the test suite.
+
+Usage:
+    python manage.py test --settings=auto_repairs_backend.settings_test
+"""
+
+from .settings import *  # noqa: F401,F403
+
+# ====== Core Settings ======
+SECRET_KEY = SECRET_KEY or "insecure-test-only-secret-key-not-for-deployment"  # noqa: F405
+# SIMPLE_JWT captured the unset key when settings.py was imported
+SIMPLE_JWT = {**SIMPLE_JWT, "SIGNING_KEY": SECRET_KEY}  # noqa: F405
+CORS_ALLOWED_ORIGINS = [origin for origin in CORS_ALLOWED_ORIGINS if origin]  # noqa: F405
+
+# ====== Database ======
+# In-memory SQLite keeps the test database off disk and out of Postgres
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": ":memory:",
+        "TEST": {"NAME": ":memory:"},
+    }
+}
+
+# Build tables straight from the models instead of replaying every migration
+MIGRATION_MODULES = {
+    app.rsplit(".", 1)[-1]: None for app in INSTALLED_APPS  # noqa: F405
+}
+
+# ====== Password Hashing ======
+# PBKDF2 is deliberately slow; tests only need passwords to round-trip
+PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
@@ -0,0 +1,95 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+User = get_user_model()
+
+
+class TokenAuthTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(
+            username="owner@autorepair.com",
+            email="owner@autorepair.com",
+            password="password123",
+            role="owner",
+        )
+
+    def test_token_authenticates_bearer_requests(self):
+        client = APIClient()
+        response = client.post(
+            "/api/token/",
+            {"email": "owner@autorepair.com", "password": "password123"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 200)
+
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {response.json()['access']}")
+        response = client.get("/api/auth/user/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["email"], "owner@autorepair.com")
+
+
+class UserStatsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        now = timezone.now()
+        cls.owner = User.objects.create_user(
+            username="owner@autorepair.com",
+            email="owner@autorepair.com",
+            password="password123",
+            role="owner",
+            is_email_verified=True,
+            last_login=now,
+            date_joined=now - timedelta(days=90),
+        )
+        User.objects.create_user(
+            username="tech@autorepair.com",
+            email="tech@autorepair.com",
+            password="password123",
+            role="employee",
+            last_login=now - timedelta(days=45),
+            date_joined=now - timedelta(days=60),
+        )
+        for number in range(2):
+            User.objects.create_user(
+                username=f"customer{number}@example.com",
+                email=f"customer{number}@example.com",
+                password="password123",
+                role="customer",
+                is_email_verified=number == 0,
+            )
+
+    def test_user_stats(self):
+        client = APIClient()
+        client.force_authenticate(self.owner)
+
+        # Every count comes from one conditional aggregate
+        with self.assertNumQueries(1):
+            response = client.get("/api/admin/users/stats/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json(),
+            {
+                "total_users": 4,
+                "role_distribution": {
+                    "counts": {"owners": 1, "employees": 1, "customers": 2},
+                    "percentages": {"owners": 25.0, "employees": 25.0, "customers": 50.0},
+                },
+                "email_verification": {
+                    "verified_count": 2,
+                    "unverified_count": 2,
+                    "verification_rate": 50.0,
+                },
+                "activity": {
+                    "active_users_30_days": 1,
+                    "recent_registrations_30_days": 2,
+                },
+                "summary": {"active_rate": 25.0, "growth_rate": 50.0},
+            },
+        )
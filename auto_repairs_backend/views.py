@@ -285,27 +285,38 @@ def get_user_stats(request):
     from django.utils import timezone
     from datetime import timedelta
 
+    thirty_days_ago = timezone.now() - timedelta(days=30)
+
+    # Collect every count in a single aggregate query
+    counts = User.objects.aggregate(
+        total=Count("id"),
+        owners=Count("id", filter=Q(role=User.OWNER)),
+        employees=Count("id", filter=Q(role=User.EMPLOYEE)),
+        customers=Count("id", filter=Q(role=User.CUSTOMER)),
+        verified=Count("id", filter=Q(is_email_verified=True)),
+        # Users who have logged in recently
+        active=Count("id", filter=Q(last_login__gte=thirty_days_ago)),
+        # Recent registrations (last 30 days)
+        recent=Count("id", filter=Q(date_joined__gte=thirty_days_ago)),
+    )
+
     # Get total user count
-    total_users = User.objects.count()
+    total_users = counts["total"]
     
     # Get role distribution
     role_stats = {
-        "owners": User.objects.filter(role=User.OWNER).count(),
-        "employees": User.objects.filter(role=User.EMPLOYEE).count(),
-        "customers": User.objects.filter(role=User.CUSTOMER).count(),
+        "owners": counts["owners"],
+        "employees": counts["employees"],
+        "customers": counts["customers"],
     }
     
     # Get email verification stats
-    verified_users = User.objects.filter(is_email_verified=True).count()
+    verified_users = counts["verified"]
     unverified_users = total_users - verified_users
     verification_rate = (verified_users / total_users * 100) if total_users > 0 else 0
     
-    # Get active user stats (users who have logged in recently)
-    thirty_days_ago = timezone.now() - timedelta(days=30)
-    active_users = User.objects.filter(last_login__gte=thirty_days_ago).count()
-    
-    # Get recent registrations (last 30 days)
-    recent_registrations = User.objects.filter(date_joined__gte=thirty_days_ago).count()
+    active_users = counts["active"]
+    recent_registrations = counts["recent"]
     
     # Calculate percentages for role distribution
     role_percentages = {}
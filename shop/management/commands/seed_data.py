@@ -1,5 +1,6 @@
 from django.core.management.base import BaseCommand
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
 from shop.models import (
     Shop,
     Employee,
@@ -15,6 +16,7 @@ from shop.models import (
 )
 from decimal import Decimal
 from datetime import datetime, timedelta
+from django.db import transaction
 from django.utils import timezone
 import random
 
@@ -31,7 +33,13 @@ class Command(BaseCommand):
             help="Clear existing data before seeding",
         )
 
+    @transaction.atomic
     def handle(self, *args, **options):
+        # Per-object progress lines are only built and shown with -v 2 or higher
+        self.verbose = options["verbosity"] > 1
+        # Every seed account shares one password, so hash it once up front
+        self.password_hash = make_password("password123")
+
         if options["clear"]:
             self.stdout.write("Clearing existing data...")
             self.clear_data()
@@ -84,6 +92,11 @@ class Command(BaseCommand):
             )
         )
 
+    def write_messages(self, messages):
+        """Write a section's progress messages with a single stdout write"""
+        if messages:
+            self.stdout.write("\n".join(messages))
+
     def clear_data(self):
         """Clear existing data"""
         RepairOrderService.objects.all().delete()
@@ -126,14 +139,16 @@ class Command(BaseCommand):
         ]
 
         shops = []
+        messages = []
         for shop_data in shops_data:
             shop, created = Shop.objects.get_or_create(
                 name=shop_data["name"], defaults=shop_data
             )
             shops.append(shop)
-            if created:
-                self.stdout.write(f"Created shop: {shop.name}")
+            if created and self.verbose:
+                messages.append(f"Created shop: {shop.name}")
 
+        self.write_messages(messages)
         return shops
 
     def create_services(self, shops):
@@ -332,6 +347,7 @@ class Command(BaseCommand):
         ]
 
         users = []
+        messages = []
         for emp_data in employees_data:
             try:
                 user = User.objects.get(email=emp_data["email"])
@@ -340,10 +356,10 @@ class Command(BaseCommand):
                 user.save()
                 created = False
             except User.DoesNotExist:
-                user = User.objects.create_user(
+                user = User.objects.create(
                     username=emp_data["email"],  # Use email as username
                     email=emp_data["email"],
-                    password="password123",
+                    password=self.password_hash,
                     first_name=emp_data["first_name"],
                     last_name=emp_data["last_name"],
                     role=emp_data["user_role"],
@@ -352,12 +368,13 @@ class Command(BaseCommand):
                 )
                 created = True
 
-            if created:
-                self.stdout.write(
+            if created and self.verbose:
+                messages.append(
                     f'Created employee user: {user.email} ({emp_data["user_role"]})'
                 )
             users.append((user, emp_data["role"]))
 
+        self.write_messages(messages)
         return users
 
     def create_customer_users(self):
@@ -396,6 +413,7 @@ class Command(BaseCommand):
         ]
 
         users = []
+        messages = []
         for cust_data in customers_data:
             try:
                 user = User.objects.get(email=cust_data["email"])
@@ -404,10 +422,10 @@ class Command(BaseCommand):
                 user.save()
                 created = False
             except User.DoesNotExist:
-                user = User.objects.create_user(
+                user = User.objects.create(
                     username=cust_data["email"],  # Use email as username
                     email=cust_data["email"],
-                    password="password123",
+                    password=self.password_hash,
                     first_name=cust_data["first_name"],
                     last_name=cust_data["last_name"],
                     role="customer",
@@ -416,10 +434,11 @@ class Command(BaseCommand):
                 )
                 created = True
 
-            if created:
-                self.stdout.write(f"Created customer user: {user.email} (customer)")
+            if created and self.verbose:
+                messages.append(f"Created customer user: {user.email} (customer)")
             users.append(user)
 
+        self.write_messages(messages)
         return users
 
     def create_employees(self, shops, employee_users):
@@ -530,14 +549,15 @@ class Command(BaseCommand):
             for _ in range(num_problems):
                 description = random.choice(problems_data)
 
-                problem = VehicleProblem.objects.create(
-                    vehicle=vehicle,
-                    description=description,
-                    resolved=random.choice([True, False]),
+                problems.append(
+                    VehicleProblem(
+                        vehicle=vehicle,
+                        description=description,
+                        resolved=random.choice([True, False]),
+                    )
                 )
-                problems.append(problem)
 
-        return problems
+        return VehicleProblem.objects.bulk_create(problems)
 
     def create_appointments(self, vehicles, problems):
         """Create appointments"""
@@ -553,16 +573,17 @@ class Command(BaseCommand):
             # Randomly assign a problem or leave None
             problem = random.choice(problems + [None, None])  # Higher chance of None
 
-            appointment = Appointment.objects.create(
-                vehicle=vehicle,
-                reported_problem=problem,
-                description=f"Scheduled maintenance and inspection for {vehicle.make} {vehicle.model}",
-                date=appointment_date,
-                status=random.choice(["pending", "in_progress", "completed"]),
+            appointments.append(
+                Appointment(
+                    vehicle=vehicle,
+                    reported_problem=problem,
+                    description=f"Scheduled maintenance and inspection for {vehicle.make} {vehicle.model}",
+                    date=appointment_date,
+                    status=random.choice(["pending", "in_progress", "completed"]),
+                )
             )
-            appointments.append(appointment)
 
-        return appointments
+        return Appointment.objects.bulk_create(appointments)
 
     def create_repair_orders(self, vehicles, services, parts):
         """Create repair orders"""
@@ -584,17 +605,19 @@ class Command(BaseCommand):
 
             # Add 1-3 services
             vehicle_services = random.sample(services, random.randint(1, 3))
-            for service in vehicle_services:
-                RepairOrderService.objects.create(
-                    repair_order=repair_order, service=service
-                )
+            RepairOrderService.objects.bulk_create(
+                RepairOrderService(repair_order=repair_order, service=service)
+                for service in vehicle_services
+            )
 
             # Add 1-4 parts
             vehicle_parts = random.sample(parts, random.randint(1, 4))
-            for part in vehicle_parts:
-                RepairOrderPart.objects.create(
+            RepairOrderPart.objects.bulk_create(
+                RepairOrderPart(
                     repair_order=repair_order, part=part, quantity=random.randint(1, 3)
                 )
+                for part in vehicle_parts
+            )
 
             # Now recalculate total cost after adding services and parts
             repair_order.total_cost = repair_order.calculate_total_cost()
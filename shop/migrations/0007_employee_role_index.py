@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-17 02:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('shop', '0006_alter_appointment_status'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='employee',
+            name='role',
+            field=models.CharField(db_index=True, max_length=100),
+        ),
+    ]
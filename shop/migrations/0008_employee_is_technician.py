@@ -0,0 +1,20 @@
+# Generated by Django 5.2.6 on 2026-10-17 02:56
+
+import django.db.models.functions.text
+import django.db.models.lookups
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('shop', '0007_employee_role_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='employee',
+            name='is_technician',
+            field=models.GeneratedField(db_index=True, db_persist=True, expression=models.Case(models.When(models.Q(django.db.models.lookups.Contains(django.db.models.functions.text.Upper('role'), 'TECHNICIAN'), django.db.models.lookups.Contains(django.db.models.functions.text.Upper('role'), 'MECHANIC'), _connector='OR'), then=models.Value(True)), default=models.Value(False)), output_field=models.BooleanField()),
+        ),
+    ]
@@ -0,0 +1,49 @@
+# Written by hand: the indexes are created in a RunPython step that only
+# runs on PostgreSQL, which makemigrations cannot generate.
+
+from django.db import migrations
+
+
+# Columns global_search matches with icontains, by table
+SEARCH_COLUMNS = {
+    "shop_vehicle": ["make", "model", "vin", "license_plate", "color"],
+    "shop_customer": ["name", "email", "address", "phone_number"],
+    "shop_repairorder": ["notes"],
+}
+
+
+def create_trigram_indexes(apps, schema_editor):
+    """Index the search columns so icontains can use pg_trgm instead of a scan"""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for table, columns in SEARCH_COLUMNS.items():
+        for column in columns:
+            # icontains compiles to UPPER("col"::text) LIKE UPPER(%s), so the
+            # index has to be on that same expression to be picked up
+            schema_editor.execute(
+                f'CREATE INDEX IF NOT EXISTS "{table}_{column}_trgm" '
+                f'ON "{table}" USING gin (UPPER("{column}"::text) gin_trgm_ops)'
+            )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    """Reverse migration - drop the trigram indexes (pg_trgm is left installed)"""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    for table, columns in SEARCH_COLUMNS.items():
+        for column in columns:
+            schema_editor.execute(f'DROP INDEX IF EXISTS "{table}_{column}_trgm"')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('shop', '0008_employee_is_technician'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -1,5 +1,7 @@
 from django.db import models
 from django.conf import settings
+from django.db.models.functions import Upper
+from django.db.models.lookups import Contains
 from django.utils import timezone
 from decimal import Decimal
 
@@ -33,10 +35,44 @@ class Shop(models.Model):
 # -------------------
 # Employees
 # -------------------
+class EmployeeQuerySet(models.QuerySet):
+    def technicians(self):
+        """Employees whose role marks them as technicians"""
+        return self.filter(is_technician=True)
+
+    def with_workload(self):
+        """Annotate the counts behind workload_count and appointments_today_count"""
+        today = timezone.now().date()
+        return self.annotate(
+            active_appointment_count=models.Count(
+                "assigned_appointments",
+                filter=models.Q(
+                    assigned_appointments__status__in=["assigned", "in_progress"]
+                ),
+            ),
+            today_appointment_count=models.Count(
+                "assigned_appointments",
+                filter=models.Q(assigned_appointments__date__date=today),
+            ),
+        )
+
+    def with_current_jobs(self):
+        """Prefetch active appointments, with vehicle and customer, into active_appointments"""
+        return self.prefetch_related(
+            models.Prefetch(
+                "assigned_appointments",
+                queryset=Appointment.objects.filter(
+                    status__in=["assigned", "in_progress"]
+                ).select_related("vehicle__customer"),
+                to_attr="active_appointments",
+            )
+        )
+
+
 class Employee(models.Model):
     shop = models.ForeignKey(Shop, on_delete=models.CASCADE, related_name="employees")
     name = models.CharField(max_length=255)
-    role = models.CharField(max_length=100)  # mechanic, receptionist, etc.
+    role = models.CharField(max_length=100, db_index=True)  # mechanic, receptionist, etc.
     phone_number = models.CharField(max_length=20)
     email = models.EmailField(blank=True, null=True)
     picture = models.ImageField(upload_to="employee_pics/", blank=True, null=True)
@@ -47,6 +83,34 @@ class Employee(models.Model):
         blank=True,
         null=True,
     )
+    # Derived from role by the database so technician lookups are an indexed
+    # equality instead of a case-insensitive substring scan. icontains would
+    # emit UPPER('%technician%'), which Postgres rejects in a generated column
+    # (no collation for the literal), so match the upper-cased role directly.
+    is_technician = models.GeneratedField(
+        expression=models.Case(
+            models.When(
+                models.Q(Contains(Upper("role"), "TECHNICIAN"))
+                | models.Q(Contains(Upper("role"), "MECHANIC")),
+                then=models.Value(True),
+            ),
+            default=models.Value(False),
+        ),
+        output_field=models.BooleanField(),
+        db_persist=True,
+        db_index=True,
+    )
+
+    objects = EmployeeQuerySet.as_manager()
+
+    def save(self, *args, **kwargs):
+        adding = self._state.adding
+        super().save(*args, **kwargs)
+        # Inserts return is_technician, but an UPDATE leaves the instance holding
+        # the value computed from the old role, so reload it when role may change
+        update_fields = kwargs.get("update_fields")
+        if not adding and (update_fields is None or "role" in update_fields):
+            self.refresh_from_db(fields=["is_technician"])
 
     # 🎯 WORKLOAD MANAGEMENT PROPERTIES
     @property
@@ -59,6 +123,8 @@ class Employee(models.Model):
     @property
     def workload_count(self):
         """Number of active appointments assigned to this technician"""
+        if hasattr(self, "active_appointment_count"):
+            return self.active_appointment_count
         return self.current_appointments.count()
 
     @property
@@ -73,6 +139,13 @@ class Employee(models.Model):
         today = timezone.now().date()
         return self.assigned_appointments.filter(date__date=today)
 
+    @property
+    def appointments_today_count(self):
+        """Number of today's appointments for this technician"""
+        if hasattr(self, "today_appointment_count"):
+            return self.today_appointment_count
+        return self.appointments_today.count()
+
     @property
     def current_jobs(self):
         """Get current job assignments with detailed information for frontend"""
@@ -97,11 +170,6 @@ class Employee(models.Model):
         
         return jobs
 
-    @property
-    def is_technician(self):
-        """Check if this employee is a technician"""
-        return "technician" in self.role.lower() or "mechanic" in self.role.lower()
-
     def __str__(self):
         return f"{self.name} - {self.shop.name}"
 
@@ -258,7 +326,7 @@ class Appointment(models.Model):
         self.assigned_at = timezone.now()
         if self.status == "pending":
             self.status = "assigned"
-        self.save()
+        self.save(update_fields=["assigned_technician", "assigned_at", "status"])
         return self
 
     def start_work(self):
@@ -266,7 +334,7 @@ class Appointment(models.Model):
         if self.assigned_technician and self.status == "assigned":
             self.started_at = timezone.now()
             self.status = "in_progress"
-            self.save()
+            self.save(update_fields=["started_at", "status"])
         return self
 
     def complete_work(self):
@@ -274,7 +342,7 @@ class Appointment(models.Model):
         if self.status == "in_progress":
             self.completed_at = timezone.now()
             self.status = "completed"
-            self.save()
+            self.save(update_fields=["completed_at", "status"])
         return self
 
     def __str__(self):
@@ -286,6 +354,13 @@ class Appointment(models.Model):
         tech_info = f" [Tech: {self.assigned_technician.name}]" if self.assigned_technician else ""
         return f"{self.vehicle.customer.name} - {self.vehicle} - {problem}{tech_info}"
 
+    class Meta:
+        indexes = [
+            # Dashboards and workload views filter by status, usually with a
+            # date bound as well (upcoming, completed this month)
+            models.Index(fields=["status", "date"], name="shop_appt_status_date_idx"),
+        ]
+
 
 # -------------------
 # Repair Orders
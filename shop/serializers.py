@@ -62,7 +62,7 @@ class EmployeeSerializer(serializers.ModelSerializer):
     
     def get_appointments_today_count(self, obj):
         """Number of appointments today for this technician"""
-        return obj.appointments_today.count() if obj.is_technician else 0
+        return obj.appointments_today_count if obj.is_technician else 0
     
     def get_is_technician(self, obj):
         """Whether this employee is a technician"""
@@ -73,7 +73,11 @@ class EmployeeSerializer(serializers.ModelSerializer):
         if not obj.is_technician:
             return []
         
-        current_appointments = obj.current_appointments
+        # Reuse the with_current_jobs() prefetch when the view loaded it
+        if hasattr(obj, "active_appointments"):
+            current_appointments = obj.active_appointments
+        else:
+            current_appointments = obj.current_appointments
         return [
             {
                 'appointment_id': apt.id,
@@ -97,6 +101,18 @@ class EmployeeSerializer(serializers.ModelSerializer):
         ]
 
 
+# Lightweight employee serializer: workload figures without the nested jobs
+class EmployeeSummarySerializer(EmployeeSerializer):
+    current_jobs = None
+
+    class Meta(EmployeeSerializer.Meta):
+        fields = [
+            "id", "name", "role", "shop",
+            "workload_count", "is_available", "appointments_today_count",
+            "is_technician"
+        ]
+
+
 # ------------------------
 # CUSTOMER
 # ------------------------
@@ -193,7 +209,7 @@ class AppointmentSerializer(serializers.ModelSerializer):
                 'name': obj.assigned_technician.name,
                 'role': obj.assigned_technician.role,
                 'email': obj.assigned_technician.email,
-                'user_id': obj.assigned_technician.user_id if obj.assigned_technician.user else None
+                'user_id': obj.assigned_technician.user_id
             }
         return None
 
@@ -302,10 +318,14 @@ class RepairOrderSerializer(serializers.ModelSerializer):
     def get_status(self, obj):
         """Get status from the most recent appointment for this vehicle"""
         try:
-            # Get the most recent appointment for this vehicle
-            appointment = Appointment.objects.filter(
-                vehicle=obj.vehicle
-            ).order_by('-date').first()
+            vehicle = obj.vehicle
+            if "appointments" in getattr(vehicle, "_prefetched_objects_cache", {}):
+                # Reuse the views' vehicle__appointments prefetch
+                appointment = max(
+                    vehicle.appointments.all(), key=lambda a: a.date, default=None
+                )
+            else:
+                appointment = vehicle.appointments.order_by('-date').first()
             
             if appointment:
                 return appointment.status
@@ -1,3 +1,635 @@
+from datetime import timedelta
+from decimal import Decimal
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.db import DatabaseError, connection
+from django.db.models import QuerySet
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from .models import (
+    Shop,
+    Employee,
+    Customer,
+    Vehicle,
+    Service,
+    Part,
+    Appointment,
+    RepairOrder,
+    RepairOrderPart,
+    RepairOrderService,
+)
+from .serializers import RepairOrderSerializer
+
+User = get_user_model()
+
+
+class ShopAPITestCase(TestCase):
+    """Shared fixtures: an owner, one shop and one customer's vehicle"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(
+            username="owner@autorepair.com",
+            email="owner@autorepair.com",
+            password="password123",
+            role="owner",
+        )
+        cls.shop = Shop.objects.create(
+            name="Main Street Auto", address="1 Main St", phone="555-0100"
+        )
+        cls.customer = Customer.objects.create(
+            name="Alice Cooper", phone_number="555-0101"
+        )
+        cls.vehicle = Vehicle.objects.create(
+            customer=cls.customer,
+            make="Toyota",
+            model="Camry",
+            year=2020,
+            vin="VIN0000000000001",
+        )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+
+
+# -------------------
+# Employees
+# -------------------
+class EmployeeTechnicianFlagTests(ShopAPITestCase):
+    def create_employee(self, role):
+        return Employee.objects.create(
+            shop=self.shop, name="John Smith", role=role, phone_number="555-0102"
+        )
+
+    def test_is_technician_follows_role_on_create(self):
+        self.assertTrue(self.create_employee("Senior Technician").is_technician)
+        self.assertTrue(self.create_employee("mechanic").is_technician)
+        self.assertFalse(self.create_employee("Receptionist").is_technician)
+
+    def test_is_technician_follows_role_change_on_save(self):
+        employee = self.create_employee("Technician")
+
+        employee.role = "clerk"
+        employee.save()
+
+        self.assertFalse(employee.is_technician)
+
+    def test_patching_role_updates_technician_fields_in_response(self):
+        employee = self.create_employee("Senior Technician")
+
+        response = self.client.patch(
+            f"/api/shop/employees/{employee.id}/",
+            {"role": "Receptionist"},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.json()["is_technician"])
+        self.assertIsNone(response.json()["is_available"])
+
+
+class WorkloadTestCase(ShopAPITestCase):
+    """
+    Technicians with a mix of appointment states:
+    - busy: assigned + in progress + completed today, one older assignment
+    - free: nothing active
+    - full: three active jobs, so not available
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.busy = cls.create_employee("Senior Technician")
+        cls.free = cls.create_employee("mechanic")
+        cls.full = cls.create_employee("Technician")
+        cls.receptionist = cls.create_employee("Receptionist")
+
+        now = timezone.now()
+        cls.create_appointment(cls.busy, "assigned", now)
+        cls.create_appointment(cls.busy, "in_progress", now)
+        cls.create_appointment(cls.busy, "completed", now)
+        cls.create_appointment(cls.busy, "assigned", now - timedelta(days=3))
+        cls.create_appointment(None, "pending", now)
+        for _ in range(3):
+            cls.create_appointment(cls.full, "in_progress", now - timedelta(days=1))
+
+    @classmethod
+    def create_employee(cls, role):
+        return Employee.objects.create(
+            shop=cls.shop, name=f"{role} employee", role=role, phone_number="555-0102"
+        )
+
+    @classmethod
+    def create_appointment(cls, technician, status, date):
+        return Appointment.objects.create(
+            vehicle=cls.vehicle, assigned_technician=technician, status=status, date=date
+        )
+
+    def add_technician_with_jobs(self):
+        """One more busy technician, to check query counts don't grow per row"""
+        technician = self.create_employee("Technician")
+        self.create_appointment(technician, "assigned", timezone.now())
+        self.create_appointment(technician, "in_progress", timezone.now())
+
+
+class EmployeeWorkloadTests(WorkloadTestCase):
+    def test_workload_properties_count_active_and_today(self):
+        for employee in (
+            Employee.objects.get(id=self.busy.id),
+            Employee.objects.with_workload().get(id=self.busy.id),
+        ):
+            self.assertEqual(employee.workload_count, 3)
+            self.assertEqual(employee.appointments_today_count, 3)
+            self.assertFalse(employee.is_available)
+
+        free = Employee.objects.with_workload().get(id=self.free.id)
+        self.assertEqual(free.workload_count, 0)
+        self.assertEqual(free.appointments_today_count, 0)
+        self.assertTrue(free.is_available)
+
+    def test_technicians_excludes_other_roles(self):
+        self.assertEqual(
+            set(Employee.objects.technicians()),
+            {self.busy, self.free, self.full},
+        )
+
+    def test_employee_list_serializes_workload(self):
+        response = self.client.get("/api/shop/employees/")
+
+        self.assertEqual(response.status_code, 200)
+        by_id = {employee["id"]: employee for employee in response.json()}
+        busy = by_id[self.busy.id]
+        self.assertEqual(busy["workload_count"], 3)
+        self.assertEqual(busy["appointments_today_count"], 3)
+        self.assertEqual(len(busy["current_jobs"]), 3)
+        self.assertEqual(busy["current_jobs"][0]["customer"], "Alice Cooper")
+        self.assertEqual(by_id[self.receptionist.id]["current_jobs"], [])
+        self.assertIsNone(by_id[self.receptionist.id]["is_available"])
+
+    def test_employee_list_query_count(self):
+        # Employees with workload annotations, then their prefetched current jobs
+        with self.assertNumQueries(2):
+            self.client.get("/api/shop/employees/")
+
+        self.add_technician_with_jobs()
+        with self.assertNumQueries(2):
+            self.client.get("/api/shop/employees/")
+
+    def test_employee_summary_omits_current_jobs(self):
+        with self.assertNumQueries(1):
+            response = self.client.get("/api/shop/employees/summary/")
+
+        self.assertEqual(response.status_code, 200)
+        by_id = {employee["id"]: employee for employee in response.json()}
+        busy = by_id[self.busy.id]
+        self.assertEqual(
+            set(busy),
+            {
+                "id", "name", "role", "shop",
+                "workload_count", "is_available", "appointments_today_count",
+                "is_technician",
+            },
+        )
+        self.assertNotIn("current_jobs", busy)
+        self.assertEqual(busy["workload_count"], 3)
+        self.assertEqual(busy["appointments_today_count"], 3)
+        self.assertFalse(busy["is_available"])
+        free = by_id[self.free.id]
+        self.assertEqual(free["workload_count"], 0)
+        self.assertEqual(free["appointments_today_count"], 0)
+        self.assertTrue(free["is_available"])
+
+        self.add_technician_with_jobs()
+        with self.assertNumQueries(1):
+            self.client.get("/api/shop/employees/summary/")
+
+
+# -------------------
+# Repair Orders
+# -------------------
+class RepairOrderTestCase(ShopAPITestCase):
+    """Adds a repair order with a service line, a two-part line and two pending appointments"""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        service = Service.objects.create(
+            shop=cls.shop, name="Oil Change", labor_cost=Decimal("100.00")
+        )
+        part = Part.objects.create(
+            shop=cls.shop,
+            name="Oil Filter",
+            category="new",
+            part_number="OF-1",
+            unit_price=Decimal("25.00"),
+        )
+        cls.repair_order = RepairOrder.objects.create(
+            vehicle=cls.vehicle, tax_percent=Decimal("0.00")
+        )
+        RepairOrderService.objects.create(repair_order=cls.repair_order, service=service)
+        RepairOrderPart.objects.create(repair_order=cls.repair_order, part=part, quantity=2)
+
+        now = timezone.now()
+        cls.older_pending = Appointment.objects.create(
+            vehicle=cls.vehicle, date=now - timedelta(days=2), status="pending"
+        )
+        cls.latest_pending = Appointment.objects.create(
+            vehicle=cls.vehicle, date=now - timedelta(days=1), status="pending"
+        )
+
+
+class RepairOrderCompleteTests(RepairOrderTestCase):
+    def complete(self, data=None):
+        return self.client.post(
+            f"/api/shop/repair-orders/{self.repair_order.id}/complete/",
+            data or {},
+            format="json",
+        )
+
+    def test_complete_reports_cost_breakdown(self):
+        response = self.complete()
+
+        self.assertEqual(response.status_code, 200)
+        breakdown = response.json()["cost_breakdown"]
+        self.assertEqual(Decimal(breakdown["labor_cost"]), Decimal("100.00"))
+        self.assertEqual(Decimal(breakdown["parts_cost"]), Decimal("50.00"))
+        self.assertEqual(Decimal(breakdown["final_total"]), Decimal("150.00"))
+
+    def test_complete_without_appointment_completes_latest_pending(self):
+        self.complete()
+
+        self.latest_pending.refresh_from_db()
+        self.older_pending.refresh_from_db()
+        self.assertEqual(self.latest_pending.status, "completed")
+        self.assertEqual(self.older_pending.status, "pending")
+
+    def test_complete_with_appointment_id_completes_that_appointment(self):
+        self.complete({"appointment_id": self.older_pending.id})
+
+        self.latest_pending.refresh_from_db()
+        self.older_pending.refresh_from_db()
+        self.assertEqual(self.older_pending.status, "completed")
+        self.assertEqual(self.latest_pending.status, "pending")
+
+    def test_complete_query_count(self):
+        # The order and its prefetched services, parts and vehicle appointments,
+        # then the save and appointment update inside one savepoint
+        with self.assertNumQueries(10):
+            response = self.complete()
+        self.assertEqual(response.status_code, 200)
+
+    def test_failed_appointment_update_rolls_back_repair_order(self):
+        with mock.patch.object(QuerySet, "update", side_effect=DatabaseError("boom")):
+            response = self.complete({"completion_notes": "All done"})
+
+        self.assertEqual(response.status_code, 400)
+        self.repair_order.refresh_from_db()
+        self.assertNotEqual(self.repair_order.notes, "All done")
+
+
+class RepairOrderBreakdownTests(RepairOrderTestCase):
+    def test_cost_breakdown_lists_line_items_and_appointments(self):
+        response = self.client.get(
+            f"/api/shop/repair-orders/{self.repair_order.id}/cost-breakdown/"
+        )
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual([c["service_name"] for c in data["labor_costs"]], ["Oil Change"])
+        self.assertEqual(data["parts_costs"][0]["total_price"], "50.00")
+        self.assertEqual(data["totals"]["subtotal"], "150.00")
+        self.assertEqual(
+            {apt["id"] for apt in data["related_appointments"]},
+            {self.older_pending.id, self.latest_pending.id},
+        )
+
+    def test_cost_breakdown_query_count(self):
+        # Line items and related appointments all come from get_object()'s prefetch
+        with self.assertNumQueries(6):
+            response = self.client.get(
+                f"/api/shop/repair-orders/{self.repair_order.id}/cost-breakdown/"
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            set(response.json()["related_appointments"][0]),
+            {"id", "description", "date", "status"},
+        )
+
+    def test_related_appointments(self):
+        response = self.client.get(
+            f"/api/shop/repair-orders/{self.repair_order.id}/related-appointments/"
+        )
+
+        self.assertEqual(response.status_code, 200)
+        appointments = response.json()["appointments"]
+        self.assertEqual(
+            {apt["id"] for apt in appointments},
+            {self.older_pending.id, self.latest_pending.id},
+        )
+        self.assertEqual(
+            set(appointments[0]),
+            {"id", "description", "date", "status", "reported_problem_id"},
+        )
+
+
+# -------------------
+# Stats
+# -------------------
+class StatsTests(ShopAPITestCase):
+    """
+    Appointments dated so each lands in a known bucket on any day of the month:
+    two today (completed, in progress), one pending in two days, and one
+    completed forty days ago, plus a repair order with one service this month
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        now = timezone.now()
+        for status, date in (
+            ("completed", now),
+            ("in_progress", now),
+            ("pending", now + timedelta(days=2)),
+            ("completed", now - timedelta(days=40)),
+        ):
+            Appointment.objects.create(vehicle=cls.vehicle, status=status, date=date)
+
+        service = Service.objects.create(
+            shop=cls.shop, name="Oil Change", labor_cost=Decimal("100.00")
+        )
+        repair_order = RepairOrder.objects.create(
+            vehicle=cls.vehicle, total_cost=Decimal("150.00")
+        )
+        RepairOrderService.objects.create(repair_order=repair_order, service=service)
+
+    def test_appointment_stats(self):
+        # One conditional aggregate, one grouped count by status
+        with self.assertNumQueries(2):
+            response = self.client.get("/api/shop/appointments/stats/")
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["total_appointments"], 4)
+        self.assertEqual(data["todays_appointments"], 2)
+        self.assertEqual(data["upcoming_appointments"], 1)
+        self.assertEqual(data["completed_this_month"], 1)
+        self.assertEqual(data["this_week_count"], 2)
+        self.assertEqual(
+            {row["status"]: row["count"] for row in data["appointments_by_status"]},
+            {"completed": 2, "in_progress": 1, "pending": 1},
+        )
+
+    def test_shop_stats(self):
+        # Shop totals, appointment totals, monthly revenue, top services
+        with self.assertNumQueries(4):
+            response = self.client.get("/api/shop/shops/stats/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json(),
+            {
+                "total_shops": 1,
+                "active_shops": 1,
+                "total_bays": 4,
+                "available_bays": 3,
+                "utilization_rate": 25.0,
+                "monthly_appointments": 3,
+                "monthly_revenue": 150.0,
+                "average_rating": 2.5,
+                "top_services": [{"service": "Oil Change", "count": 1}],
+            },
+        )
+
+
+# -------------------
+# Technician workflow
+# -------------------
+class TechnicianWorkflowTests(ShopAPITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.technician = Employee.objects.create(
+            shop=cls.shop, name="John Smith", role="Technician", phone_number="555-0102"
+        )
+
+    def test_assign_start_complete(self):
+        appointment = Appointment.objects.create(
+            vehicle=self.vehicle, date=timezone.now(), status="pending"
+        )
+        base_url = f"/api/shop/appointments/{appointment.id}"
+
+        response = self.client.post(
+            f"{base_url}/assign-technician/",
+            {"technician_id": self.technician.id},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["appointment"]["status"], "assigned")
+        self.assertEqual(
+            response.json()["appointment"]["assigned_technician"]["id"],
+            self.technician.id,
+        )
+
+        response = self.client.post(f"{base_url}/start-work/", format="json")
+        self.assertEqual(response.status_code, 200)
+
+        response = self.client.post(f"{base_url}/complete-work/", format="json")
+        self.assertEqual(response.status_code, 200)
+
+        appointment.refresh_from_db()
+        self.assertEqual(appointment.status, "completed")
+        self.assertIsNotNone(appointment.started_at)
+        self.assertIsNotNone(appointment.completed_at)
+
+    def test_unknown_appointment_is_404(self):
+        for action in ("assign-technician", "start-work", "complete-work"):
+            response = self.client.post(
+                f"/api/shop/appointments/999999/{action}/",
+                {"technician_id": self.technician.id},
+                format="json",
+            )
+            self.assertEqual(response.status_code, 404, action)
+
+
+class TechnicianEndpointTests(WorkloadTestCase):
+    def test_workload_reports_each_technician(self):
+        response = self.client.get("/api/shop/technicians/workload/")
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(
+            data["summary"],
+            {
+                "total_technicians": 3,
+                "available_technicians": 1,
+                "busy_technicians": 2,
+                "utilization_rate": "66.7%",
+            },
+        )
+        by_id = {t["technician"]["id"]: t for t in data["technicians"]}
+        busy = by_id[self.busy.id]
+        self.assertEqual(busy["workload"]["current_appointments"], 3)
+        self.assertEqual(busy["workload"]["appointments_today"], 3)
+        self.assertFalse(busy["workload"]["is_available"])
+        self.assertEqual(len(busy["current_jobs"]), 3)
+        self.assertEqual(
+            {job["status"] for job in busy["current_jobs"]}, {"assigned", "in_progress"}
+        )
+
+    def test_workload_query_count(self):
+        # Annotated technicians joined to their shop, then the current jobs
+        with self.assertNumQueries(2):
+            self.client.get("/api/shop/technicians/workload/")
+
+        self.add_technician_with_jobs()
+        with self.assertNumQueries(2):
+            self.client.get("/api/shop/technicians/workload/")
+
+    def test_available_lists_technicians_under_capacity(self):
+        response = self.client.get("/api/shop/technicians/available/")
+
+        self.assertEqual(response.status_code, 200)
+        available = response.json()["available_technicians"]
+        self.assertEqual([t["id"] for t in available], [self.free.id])
+        self.assertEqual(available[0]["current_workload"], 0)
+
+    def test_available_query_count(self):
+        with self.assertNumQueries(1):
+            self.client.get("/api/shop/technicians/available/")
+
+        self.add_technician_with_jobs()
+        with self.assertNumQueries(1):
+            self.client.get("/api/shop/technicians/available/")
+
+
+class RepairOrderListTests(RepairOrderTestCase):
+    def test_status_comes_from_latest_appointment(self):
+        Appointment.objects.filter(id=self.latest_pending.id).update(status="in_progress")
+
+        response = self.client.get("/api/shop/repair-orders/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()[0]["status"], "in_progress")
+
+    def test_status_without_prefetch_reads_one_appointment(self):
+        # Serialising outside the views has no prefetch to reuse
+        repair_order = RepairOrder.objects.select_related("vehicle__customer").get(
+            id=self.repair_order.id
+        )
+        serializer = RepairOrderSerializer(repair_order)
+
+        with CaptureQueriesContext(connection) as queries:
+            status = serializer.get_status(repair_order)
+        self.assertEqual(status, "pending")
+        self.assertEqual(len(queries), 1)
+        self.assertIn("LIMIT 1", queries[0]["sql"])
+
+    def test_list_query_count(self):
+        # Orders joined to vehicle and customer, then the prefetched services,
+        # parts and vehicle appointments
+        with self.assertNumQueries(6):
+            self.client.get("/api/shop/repair-orders/")
+
+        second_vehicle = Vehicle.objects.create(
+            customer=self.customer, make="Honda", model="Civic", year=2019, vin="VIN0000000000002"
+        )
+        RepairOrder.objects.create(vehicle=second_vehicle)
+        Appointment.objects.create(vehicle=second_vehicle, date=timezone.now())
+        with self.assertNumQueries(6):
+            self.client.get("/api/shop/repair-orders/")
+
+    def test_active_filters_on_latest_appointment_status(self):
+        # The fixture order's latest appointment is pending; make it in progress
+        Appointment.objects.filter(id=self.latest_pending.id).update(status="in_progress")
+        # An older pending appointment doesn't keep a completed order active
+        done_vehicle = Vehicle.objects.create(
+            customer=self.customer, make="Honda", model="Civic", year=2019, vin="VIN0000000000002"
+        )
+        RepairOrder.objects.create(vehicle=done_vehicle)
+        now = timezone.now()
+        Appointment.objects.create(
+            vehicle=done_vehicle, date=now - timedelta(days=3), status="pending"
+        )
+        Appointment.objects.create(
+            vehicle=done_vehicle, date=now - timedelta(days=1), status="completed"
+        )
+
+        # The filtered orders, then the same prefetches as the list
+        with self.assertNumQueries(6):
+            response = self.client.get("/api/shop/repair-orders/active/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([order["id"] for order in response.json()], [self.repair_order.id])
+        self.assertEqual(response.json()[0]["status"], "in_progress")
+
+    def test_stats_count_each_order_once(self):
+        # The fixture vehicle has pending appointments; a completed one as well
+        # makes its order both active and completed, but only once each
+        RepairOrder.objects.filter(id=self.repair_order.id).update(total_cost=Decimal("150.00"))
+        Appointment.objects.create(
+            vehicle=self.vehicle, date=timezone.now() - timedelta(days=5), status="completed"
+        )
+
+        # One aggregate for the totals, one grouped count by appointment status
+        with self.assertNumQueries(2):
+            response = self.client.get("/api/shop/repair-orders/stats/")
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["total_orders"], 1)
+        self.assertEqual(data["active_orders"], 1)
+        self.assertEqual(data["completed_orders"], 1)
+        self.assertEqual(Decimal(str(data["total_revenue"])), Decimal("150.00"))
+        self.assertEqual(Decimal(str(data["average_order_value"])), Decimal("150.00"))
+        self.assertEqual(data["orders_this_month"], 1)
+        self.assertEqual(
+            sorted(
+                (row["vehicle__appointments__status"], row["count"])
+                for row in data["orders_by_appointment_status"]
+            ),
+            [("completed", 1), ("pending", 1)],
+        )
+
+    def test_retrieve_query_count(self):
+        with self.assertNumQueries(6):
+            response = self.client.get(f"/api/shop/repair-orders/{self.repair_order.id}/")
+        self.assertEqual(response.json()["status"], "pending")
+
+
+# -------------------
+# Global search
+# -------------------
+class GlobalSearchTests(RepairOrderTestCase):
+    def test_customer_with_two_matching_vehicles_appears_once(self):
+        second_vehicle = Vehicle.objects.create(
+            customer=self.customer, make="Toyota", model="Corolla", year=2018, vin="VIN0000000000002"
+        )
+        RepairOrder.objects.create(vehicle=second_vehicle, notes="Brake pads")
+
+        # Vehicles, customers and repair orders: one query each
+        with self.assertNumQueries(3):
+            response = self.client.get("/api/shop/search/", {"q": "toyota"})
 
-# Create your tests here.
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(len(data["vehicles"]), 2)
+        self.assertEqual([c["id"] for c in data["customers"]], [self.customer.id])
+        self.assertEqual(
+            set(data["customers"][0]),
+            {"id", "name", "email", "phone_number", "address", "type"},
+        )
+        self.assertEqual(len(data["repair_orders"]), 2)
+        order = data["repair_orders"][0]
+        self.assertEqual(
+            set(order), {"id", "total_cost", "date_created", "notes", "vehicle", "type"}
+        )
+        self.assertEqual(
+            set(order["vehicle"]), {"id", "make", "model", "year", "customer_name"}
+        )
+        self.assertEqual(order["vehicle"]["customer_name"], "Alice Cooper")
+        self.assertEqual(data["total_results"], 5)
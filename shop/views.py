@@ -5,8 +5,8 @@ from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.decorators import action, api_view, permission_classes
 from django_filters.rest_framework import DjangoFilterBackend
-from django.db.models import Q
-from django.db import models
+from django.db.models import OuterRef, Q, Subquery
+from django.db import models, transaction
 from typing import Any, Dict, List
 
 from .models import (
@@ -38,6 +38,7 @@ from .serializers import (
     ServiceSerializer,
     PartSerializer,
     EmployeeSerializer,
+    EmployeeSummarySerializer,
     CustomerSerializer,
     VehicleSerializer,
     VehicleProblemSerializer,
@@ -97,7 +98,16 @@ def global_search(request):
             | Q(vin__icontains=search_query)
             | Q(license_plate__icontains=search_query)
             | Q(color__icontains=search_query)
-        ).select_related("customer")
+        ).select_related("customer").only(
+            "make",
+            "model",
+            "year",
+            "vin",
+            "license_plate",
+            "color",
+            "customer__name",
+            "customer__email",
+        )
 
         # Serialize vehicles
         vehicle_results = []
@@ -131,28 +141,26 @@ def global_search(request):
         elif user.is_customer and hasattr(user, "customer_profile"):
             customer_queryset = Customer.objects.filter(id=user.customer_profile.id)
 
+        # Matching owners come from an id subquery rather than a join, so
+        # customers with several matching vehicles don't need a DISTINCT
+        matching_vehicle_owners = Vehicle.objects.filter(
+            Q(make__icontains=search_query) | Q(model__icontains=search_query)
+        ).values("customer_id")
         customers = customer_queryset.filter(
             Q(name__icontains=search_query)
             | Q(email__icontains=search_query)
             | Q(address__icontains=search_query)
             | Q(phone_number__icontains=search_query)
-            | Q(vehicles__make__icontains=search_query)
-            | Q(vehicles__model__icontains=search_query)
-        ).distinct()
-
-        # Serialize customers
-        customer_results = []
-        for customer in customers:
-            customer_results.append(
-                {
-                    "id": customer.id,  # type: ignore
-                    "name": customer.name,
-                    "email": customer.email,
-                    "phone_number": customer.phone_number,
-                    "address": customer.address,
-                    "type": "customer",
-                }
+            | Q(id__in=matching_vehicle_owners)
+        )
+
+        # Serialize customers straight from the row values, no model instances needed
+        customer_results = [
+            {**customer, "type": "customer"}
+            for customer in customers.values(
+                "id", "name", "email", "phone_number", "address"
             )
+        ]
         results["customers"] = customer_results
 
         # Search Repair Orders - by notes AND orders for matching vehicles
@@ -169,7 +177,15 @@ def global_search(request):
             | Q(vehicle__make__icontains=search_query)
             | Q(vehicle__model__icontains=search_query)
             | Q(vehicle__vin__icontains=search_query)
-        ).select_related("vehicle", "vehicle__customer")
+        ).select_related("vehicle", "vehicle__customer").only(
+            "total_cost",
+            "date_created",
+            "notes",
+            "vehicle__make",
+            "vehicle__model",
+            "vehicle__year",
+            "vehicle__customer__name",
+        )
 
         # Serialize repair orders
         order_results = []
@@ -246,16 +262,30 @@ class ShopViewSet(BaseViewSet):
         """Filter shops based on user role"""
         user = self.request.user
         if user.is_owner:
-            return Shop.objects.all()
+            queryset = Shop.objects.all()
         elif user.is_employee and hasattr(user, "employee_profile"):  # type: ignore
-            return Shop.objects.filter(id=user.employee_profile.shop.id)  # type: ignore
-        return Shop.objects.none()
+            queryset = Shop.objects.filter(id=user.employee_profile.shop_id)  # type: ignore
+        else:
+            return Shop.objects.none()
+
+        if self.action in ["list", "retrieve"]:
+            # ShopSerializer nests services, parts and employees; load them per
+            # page instead of per shop
+            queryset = queryset.prefetch_related(
+                "services",
+                "parts",
+                models.Prefetch(
+                    "employees",
+                    queryset=Employee.objects.with_workload().with_current_jobs(),
+                ),
+            )
+        return queryset
 
     @action(detail=True, methods=["get"])
     def employees(self, request, pk=None):
         """Get employees for a specific shop"""
         shop = self.get_object()
-        employees = Employee.objects.filter(shop=shop)
+        employees = Employee.objects.with_workload().with_current_jobs().filter(shop=shop)
         serializer = EmployeeSerializer(employees, many=True)
         return Response(serializer.data)
 
@@ -282,10 +312,7 @@ class ServiceViewSet(BaseViewSet):
     def get_queryset(self):
         """Filter services based on user's accessible shops"""
         user = self.request.user
-        accessible_shops = user.get_accessible_shops()
-        if accessible_shops:
-            return Service.objects.filter(shop__in=accessible_shops)
-        return Service.objects.none()
+        return Service.objects.filter(shop__in=user.get_accessible_shops())
 
 
 # -------------------
@@ -302,10 +329,7 @@ class PartViewSet(BaseViewSet):
     def get_queryset(self):
         """Filter parts based on user's accessible shops"""
         user = self.request.user
-        accessible_shops = user.get_accessible_shops()
-        if accessible_shops:
-            return Part.objects.filter(shop__in=accessible_shops)
-        return Part.objects.none()
+        return Part.objects.filter(shop__in=user.get_accessible_shops())
 
     @action(detail=False, methods=["get"])
     def low_stock(self, request):
@@ -329,13 +353,24 @@ class EmployeeViewSet(BaseViewSet):
     def get_queryset(self):
         """Only owners can see all employees"""
         user = self.request.user
+        # Workload counts are annotated and current jobs prefetched so the
+        # serializer doesn't query per employee
+        queryset = Employee.objects.with_workload().with_current_jobs()
         if user.is_owner:
-            return Employee.objects.all()
+            return queryset
         elif user.is_employee and hasattr(user, "employee_profile"):  # type: ignore
             # Employees can only see colleagues in their shop
-            return Employee.objects.filter(shop=user.employee_profile.shop)  # type: ignore
+            return queryset.filter(shop_id=user.employee_profile.shop_id)  # type: ignore
         return Employee.objects.none()
 
+    @action(detail=False, methods=["get"])
+    def summary(self, request):
+        """Workload figures for employees without the nested current jobs"""
+        # The summary doesn't render current_jobs, so skip their prefetch
+        employees = self.filter_queryset(self.get_queryset()).prefetch_related(None)
+        serializer = EmployeeSummarySerializer(employees, many=True)
+        return Response(serializer.data)
+
 
 # -------------------
 # Customer ViewSet
@@ -639,21 +674,36 @@ class AppointmentViewSet(BaseViewSet):
         # Get base queryset respecting user permissions
         base_queryset = self.get_queryset()
 
+        # Compute all counts with conditional aggregation in one query
+        counts = base_queryset.aggregate(
+            total=Count("id"),
+            today=Count("id", filter=Q(date__date=today)),
+            upcoming=Count(
+                "id", filter=Q(date__gt=now, status__in=["pending", "in_progress"])
+            ),
+            completed_this_month=Count(
+                "id", filter=Q(date__gte=this_month, status="completed")
+            ),
+            this_week=Count(
+                "id",
+                filter=Q(
+                    date__gte=today - timedelta(days=7),
+                    date__lt=today + timedelta(days=1),
+                ),
+            ),
+        )
+
         stats = {
-            "total_appointments": base_queryset.count(),
-            "todays_appointments": base_queryset.filter(date__date=today).count(),
-            "upcoming_appointments": base_queryset.filter(
-                date__gt=now, status__in=["pending", "in_progress"]
-            ).count(),
-            "completed_this_month": base_queryset.filter(
-                date__gte=this_month, status="completed"
-            ).count(),
+            "total_appointments": counts["total"],
+            "todays_appointments": counts["today"],
+            "upcoming_appointments": counts["upcoming"],
+            "completed_this_month": counts["completed_this_month"],
+            # Clear the -date ordering, which would otherwise join the GROUP BY
+            # and split each status into one row per appointment date
             "appointments_by_status": list(
-                base_queryset.values("status").annotate(count=Count("id"))
+                base_queryset.values("status").annotate(count=Count("id")).order_by()
             ),
-            "this_week_count": base_queryset.filter(
-                date__gte=today - timedelta(days=7), date__lt=today + timedelta(days=1)
-            ).count(),
+            "this_week_count": counts["this_week"],
         }
 
         return Response(stats)
@@ -715,7 +765,7 @@ class AppointmentViewSet(BaseViewSet):
             
             # Filter appointments assigned to this technician
             queryset = Appointment.objects.select_related(
-                'vehicle__customer', 'reported_problem'
+                'vehicle__customer', 'reported_problem', 'assigned_technician'
             ).filter(
                 assigned_technician=employee
             )
@@ -769,7 +819,7 @@ class AppointmentViewSet(BaseViewSet):
             
             # Filter appointments for this customer's vehicles
             queryset = Appointment.objects.select_related(
-                'vehicle', 'vehicle__customer', 'reported_problem', 'assigned_technician__user'
+                'vehicle', 'vehicle__customer', 'reported_problem', 'assigned_technician'
             ).filter(
                 vehicle__customer=customer
             )
@@ -932,74 +982,64 @@ class RepairOrderViewSet(BaseViewSet):
         the status computation in RepairOrderSerializer.get_status().
         """
         active_statuses = ["pending", "in_progress"]
-        active_orders = []
-        
-        # Get all repair orders and check their computed status
-        for order in self.get_queryset():
-            try:
-                # Get the most recent appointment for this vehicle
-                most_recent_appointment = order.vehicle.appointments.order_by('-date').first()
-                if most_recent_appointment and most_recent_appointment.status in active_statuses:
-                    active_orders.append(order)
-            except Exception:
-                # Skip orders without appointments or with errors
-                continue
-        
-        # Convert to queryset for consistent behavior
-        if active_orders:
-            order_ids = [order.id for order in active_orders]
-            orders_queryset = self.get_queryset().filter(id__in=order_ids).order_by('-date_created')
-        else:
-            orders_queryset = self.get_queryset().none()
-        
+
+        # Status of the most recent appointment for each order's vehicle,
+        # resolved in the database instead of one query per order
+        most_recent_status = (
+            Appointment.objects.filter(vehicle=OuterRef("vehicle"))
+            .order_by("-date")
+            .values("status")[:1]
+        )
+        orders_queryset = (
+            self.get_queryset()
+            .annotate(latest_appointment_status=Subquery(most_recent_status))
+            .filter(latest_appointment_status__in=active_statuses)
+        )
+
         serializer = self.get_serializer(orders_queryset, many=True)
         return Response(serializer.data)
 
     @action(detail=False, methods=["get"])
     def stats(self, request):
         """Get repair order statistics"""
-        from django.db.models import Count, Sum, Avg
-        from datetime import date, timedelta
+        from django.db.models import Count, Exists, Sum, Avg
+        from datetime import date
 
         queryset = self.get_queryset()
         today = date.today()
         this_month = today.replace(day=1)
 
-    @action(detail=False, methods=["get"])
-    def stats(self, request):
-        """Get repair order statistics"""
-        from django.db.models import Count, Sum, Avg
-        from datetime import date, timedelta
+        # EXISTS keeps each order counted once however many appointments its
+        # vehicle has, so every total comes out of a single aggregate
+        vehicle_appointments = Appointment.objects.filter(vehicle=OuterRef("vehicle"))
+        is_active = Q(has_active_appointment=True)
+        is_completed = Q(has_completed_appointment=True)
 
-        queryset = self.get_queryset()
-        today = date.today()
-        this_month = today.replace(day=1)
+        totals = queryset.annotate(
+            has_active_appointment=Exists(
+                vehicle_appointments.filter(status__in=["pending", "in_progress"])
+            ),
+            has_completed_appointment=Exists(
+                vehicle_appointments.filter(status="completed")
+            ),
+        ).aggregate(
+            total_orders=Count("id"),
+            active_orders=Count("id", filter=is_active),
+            completed_orders=Count("id", filter=is_completed),
+            total_revenue=Sum("total_cost", filter=is_completed),
+            average_order_value=Avg("total_cost", filter=is_completed),
+            orders_this_month=Count(
+                "id", filter=Q(date_created__date__gte=this_month)
+            ),
+        )
 
         stats = {
-            "total_orders": queryset.count(),
-            "active_orders": queryset.filter(
-                vehicle__appointments__status__in=["pending", "in_progress"]
-            )
-            .distinct()
-            .count(),
-            "completed_orders": queryset.filter(
-                vehicle__appointments__status="completed"
-            )
-            .distinct()
-            .count(),
-            "total_revenue": queryset.filter(vehicle__appointments__status="completed")
-            .distinct()
-            .aggregate(total=Sum("total_cost"))["total"]
-            or 0,
-            "average_order_value": queryset.filter(
-                vehicle__appointments__status="completed"
-            )
-            .distinct()
-            .aggregate(avg=Avg("total_cost"))["avg"]
-            or 0,
-            "orders_this_month": queryset.filter(
-                date_created__date__gte=this_month
-            ).count(),
+            "total_orders": totals["total_orders"],
+            "active_orders": totals["active_orders"],
+            "completed_orders": totals["completed_orders"],
+            "total_revenue": totals["total_revenue"] or 0,
+            "average_order_value": totals["average_order_value"] or 0,
+            "orders_this_month": totals["orders_this_month"],
             "orders_by_appointment_status": list(
                 queryset.values("vehicle__appointments__status")
                 .annotate(count=Count("id", distinct=True))
@@ -1092,16 +1132,16 @@ class RepairOrderViewSet(BaseViewSet):
 
         from django.db.models import Sum, Count
 
-        queryset = self.get_queryset()
+        totals = self.get_queryset().aggregate(
+            total_orders=Count("id"),
+            total_revenue=Sum("total_cost"),
+            avg_cost=Sum("total_cost") / Count("id"),
+        )
 
         summary = {
-            "total_orders": queryset.count(),
-            "total_revenue": queryset.aggregate(Sum("total_cost"))["total_cost__sum"]
-            or 0,
-            "average_order_value": queryset.aggregate(
-                avg_cost=Sum("total_cost") / Count("id")
-            )["avg_cost"]
-            or 0,
+            "total_orders": totals["total_orders"],
+            "total_revenue": totals["total_revenue"] or 0,
+            "average_order_value": totals["avg_cost"] or 0,
         }
 
         return Response(summary)
@@ -1116,13 +1156,13 @@ class RepairOrderViewSet(BaseViewSet):
             # Calculate labor costs from associated services
             labor_total = sum(
                 ros.service.labor_cost
-                for ros in repair_order.repairorderservice_set.all()  # type: ignore
+                for ros in repair_order.repair_order_services.all()  # type: ignore
             )
 
             # Calculate parts costs from associated parts
             parts_total = sum(
                 rop.part.unit_price * rop.quantity
-                for rop in repair_order.repairorderpart_set.all()  # type: ignore
+                for rop in repair_order.repair_order_parts.all()  # type: ignore
             )
 
             # Calculate final total using existing fields
@@ -1139,33 +1179,28 @@ class RepairOrderViewSet(BaseViewSet):
 
             final_total = subtotal - discount_value + tax_value
 
-            # Update only existing fields
-            repair_order.total_cost = final_total
-            repair_order.notes = request.data.get(
-                "completion_notes", repair_order.notes
-            )
-            repair_order.save()
-
-            # Update related appointment status to completed
-            appointment_id = request.data.get("appointment_id")
-            if appointment_id:
-                try:
-                    appointment = Appointment.objects.get(
-                        id=appointment_id, vehicle=repair_order.vehicle
-                    )
-                    appointment.status = "completed"
-                    appointment.save()
-                except Appointment.DoesNotExist:
-                    pass
-            else:
-                # Complete pending appointments for this vehicle
-                pending_appointments = Appointment.objects.filter(
-                    vehicle=repair_order.vehicle, status="pending"
+            with transaction.atomic():
+                # Update only existing fields
+                repair_order.total_cost = final_total
+                repair_order.notes = request.data.get(
+                    "completion_notes", repair_order.notes
                 )
-                if pending_appointments.exists():
-                    latest = pending_appointments.order_by("-date").first()
-                    latest.status = "completed"  # type: ignore
-                    latest.save()  # type: ignore
+                repair_order.save()
+
+                # Update related appointment status to completed
+                appointments = Appointment.objects.filter(vehicle=repair_order.vehicle)
+                appointment_id = request.data.get("appointment_id")
+                if appointment_id:
+                    appointments = appointments.filter(id=appointment_id)
+                else:
+                    # Complete the most recent pending appointment for this vehicle
+                    latest_pending = (
+                        appointments.filter(status="pending")
+                        .order_by("-date")
+                        .values("id")[:1]
+                    )
+                    appointments = appointments.filter(id__in=latest_pending)
+                appointments.update(status="completed")
 
             return Response(
                 {
@@ -1198,7 +1233,7 @@ class RepairOrderViewSet(BaseViewSet):
         parts_costs = []
 
         # Labor breakdown from services
-        for service_relation in repair_order.repairorderservice_set.all():  # type: ignore
+        for service_relation in repair_order.repair_order_services.all():  # type: ignore
             labor_costs.append(
                 {
                     "service_name": service_relation.service.name,
@@ -1208,7 +1243,7 @@ class RepairOrderViewSet(BaseViewSet):
             )
 
         # Parts breakdown
-        for part_relation in repair_order.repairorderpart_set.all():  # type: ignore
+        for part_relation in repair_order.repair_order_parts.all():  # type: ignore
             parts_costs.append(
                 {
                     "part_name": part_relation.part.name,
@@ -1264,7 +1299,8 @@ class RepairOrderViewSet(BaseViewSet):
                         "date": apt.date.isoformat(),
                         "status": apt.status,
                     }
-                    for apt in Appointment.objects.filter(vehicle=repair_order.vehicle)
+                    # Served from the vehicle__appointments prefetch
+                    for apt in repair_order.vehicle.appointments.all()
                 ],
             }
         )
@@ -1273,20 +1309,16 @@ class RepairOrderViewSet(BaseViewSet):
     def related_appointments(self, request, pk=None):
         """Get appointments for the same vehicle as this repair order"""
         repair_order = self.get_object()
-        appointments = Appointment.objects.filter(vehicle=repair_order.vehicle)
+        appointments = Appointment.objects.filter(
+            vehicle_id=repair_order.vehicle_id
+        ).values("id", "description", "date", "status", "reported_problem_id")
 
         return Response(
             {
                 "repair_order_id": repair_order.id,
-                "vehicle_id": repair_order.vehicle.id,
+                "vehicle_id": repair_order.vehicle_id,
                 "appointments": [
-                    {
-                        "id": apt.id,
-                        "description": apt.description,
-                        "date": apt.date.isoformat(),
-                        "status": apt.status,
-                        "reported_problem_id": apt.reported_problem_id,
-                    }
+                    {**apt, "date": apt["date"].isoformat()}
                     for apt in appointments
                 ],
             }
@@ -1306,15 +1338,17 @@ class RepairOrderPartViewSet(BaseViewSet):
 
     def get_queryset(self):
         """Filter repair order parts based on user role"""
+        base_queryset = RepairOrderPart.objects.select_related("part")
+
         user = self.request.user
         if user.is_owner or user.is_employee:
-            return RepairOrderPart.objects.all()
+            return base_queryset.all()
         elif user.is_customer and hasattr(user, "customer_profile"):
             # Customers can only see parts for their own repair orders
-            return RepairOrderPart.objects.filter(
+            return base_queryset.filter(
                 repair_order__vehicle__customer=user.customer_profile
             )
-        return RepairOrderPart.objects.none()
+        return base_queryset.none()
 
 
 # -------------------
@@ -1330,15 +1364,17 @@ class RepairOrderServiceViewSet(BaseViewSet):
 
     def get_queryset(self):
         """Filter repair order services based on user role"""
+        base_queryset = RepairOrderService.objects.select_related("service")
+
         user = self.request.user
         if user.is_owner or user.is_employee:
-            return RepairOrderService.objects.all()
+            return base_queryset.all()
         elif user.is_customer and hasattr(user, "customer_profile"):
             # Customers can only see services for their own repair orders
-            return RepairOrderService.objects.filter(
+            return base_queryset.filter(
                 repair_order__vehicle__customer=user.customer_profile
             )
-        return RepairOrderService.objects.none()
+        return base_queryset.none()
 
 
 # -------------------
@@ -1390,12 +1426,25 @@ def shop_stats(request):
     current_month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
 
     # Shop metrics
-    total_shops = Shop.objects.count()
-    active_shops = Shop.objects.filter(is_active=True).count()
-    total_bays = Shop.objects.aggregate(total=Sum("bay_count"))["total"] or 0
+    shop_totals = Shop.objects.aggregate(
+        total=Count("id"),
+        active=Count("id", filter=Q(is_active=True)),
+        bays=Sum("bay_count"),
+    )
+    total_shops = shop_totals["total"]
+    active_shops = shop_totals["active"]
+    total_bays = shop_totals["bays"] or 0
+
+    # Appointment metrics
+    appointment_totals = Appointment.objects.aggregate(
+        total=Count("id"),
+        in_progress=Count("id", filter=Q(status="in_progress")),
+        completed=Count("id", filter=Q(status="completed")),
+        this_month=Count("id", filter=Q(date__gte=current_month_start)),
+    )
 
     # Calculate available bays (bays not currently occupied by in-progress appointments)
-    occupied_bays = Appointment.objects.filter(status="in_progress").count()
+    occupied_bays = appointment_totals["in_progress"]
     available_bays = max(0, total_bays - occupied_bays)
 
     # Calculate utilization rate
@@ -1404,9 +1453,7 @@ def shop_stats(request):
     )
 
     # Monthly appointments
-    monthly_appointments = Appointment.objects.filter(
-        date__gte=current_month_start
-    ).count()
+    monthly_appointments = appointment_totals["this_month"]
 
     # Monthly revenue from completed repair orders
     monthly_revenue = (
@@ -1418,8 +1465,8 @@ def shop_stats(request):
 
     # Average rating (placeholder - you may need to add a rating system)
     # For now, using a calculated average based on appointment completion
-    total_appointments = Appointment.objects.count()
-    completed_appointments = Appointment.objects.filter(status="completed").count()
+    total_appointments = appointment_totals["total"]
+    completed_appointments = appointment_totals["completed"]
     average_rating = round(
         (
             (completed_appointments / total_appointments * 5.0)
@@ -1462,6 +1509,21 @@ def shop_stats(request):
 # TECHNICIAN ALLOCATION ENDPOINTS
 # ================================
 
+def get_workflow_appointment(appointment_id):
+    """
+    Fetch an appointment for the assign/start/complete endpoints, joined to
+    the relations AppointmentSerializer renders in their responses
+    """
+    from django.shortcuts import get_object_or_404
+
+    return get_object_or_404(
+        Appointment.objects.select_related(
+            'vehicle__customer', 'reported_problem', 'assigned_technician'
+        ),
+        id=appointment_id
+    )
+
+
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
 def assign_technician(request, appointment_id):
@@ -1474,16 +1536,17 @@ def assign_technician(request, appointment_id):
     from django.shortcuts import get_object_or_404
     from django.utils import timezone
     
-    appointment = get_object_or_404(Appointment, id=appointment_id)
     technician_id = request.data.get('technician_id')
     
+    # Reject malformed requests before touching the database
     if not technician_id:
         return Response(
             {'error': 'technician_id is required'}, 
             status=status.HTTP_400_BAD_REQUEST
         )
     
-    technician = get_object_or_404(Employee, id=technician_id)
+    appointment = get_workflow_appointment(appointment_id)
+    technician = get_object_or_404(Employee.objects.with_workload(), id=technician_id)
     
     # Check if technician is available
     if not technician.is_available:
@@ -1523,9 +1586,7 @@ def start_work(request, appointment_id):
     
     POST /api/shop/appointments/{id}/start-work/
     """
-    from django.shortcuts import get_object_or_404
-    
-    appointment = get_object_or_404(Appointment, id=appointment_id)
+    appointment = get_workflow_appointment(appointment_id)
     
     if not appointment.assigned_technician:
         return Response({
@@ -1564,9 +1625,7 @@ def complete_work(request, appointment_id):
     
     POST /api/shop/appointments/{id}/complete-work/
     """
-    from django.shortcuts import get_object_or_404
-    
-    appointment = get_object_or_404(Appointment, id=appointment_id)
+    appointment = get_workflow_appointment(appointment_id)
     
     if appointment.status != 'in_progress':
         return Response({
@@ -1601,16 +1660,16 @@ def technician_workload(request):
     
     GET /api/shop/technicians/workload/
     """
-    technicians = Employee.objects.filter(
-        role__icontains='technician'
-    ).select_related('shop')
+    technicians = (
+        Employee.objects.technicians()
+        .with_workload()
+        .with_current_jobs()
+        .select_related('shop')
+    )
     
     workload_data = []
     
     for tech in technicians:
-        current_appointments = tech.current_appointments
-        today_appointments = tech.appointments_today
-        
         workload_data.append({
             'technician': {
                 'id': tech.id,
@@ -1621,7 +1680,7 @@ def technician_workload(request):
             'workload': {
                 'current_appointments': tech.workload_count,
                 'is_available': tech.is_available,
-                'appointments_today': today_appointments.count(),
+                'appointments_today': tech.appointments_today_count,
                 'max_capacity': 3
             },
             'current_jobs': [
@@ -1632,13 +1691,13 @@ def technician_workload(request):
                     'status': apt.status,
                     'assigned_at': apt.assigned_at,
                     'started_at': apt.started_at
-                } for apt in current_appointments
+                } for apt in tech.active_appointments
             ]
         })
     
     # Summary statistics
     total_technicians = len(workload_data)
-    available_technicians = len([t for t in workload_data if t['workload']['is_available']])
+    available_technicians = sum(1 for t in workload_data if t['workload']['is_available'])
     busy_technicians = total_technicians - available_technicians
     
     return Response({
@@ -1660,22 +1719,24 @@ def available_technicians(request):
     
     GET /api/shop/technicians/available/
     """
-    available_techs = Employee.objects.filter(
-        role__icontains='technician'
-    ).select_related('shop')
-    
-    available_list = []
+    # Same threshold as Employee.is_available, applied in SQL on the annotation
+    available_techs = (
+        Employee.objects.technicians()
+        .with_workload()
+        .filter(active_appointment_count__lt=3)
+        .select_related('shop')
+    )
     
-    for tech in available_techs:
-        if tech.is_available:
-            available_list.append({
-                'id': tech.id,
-                'name': tech.name,
-                'role': tech.role,
-                'current_workload': tech.workload_count,
-                'max_capacity': 3,
-                'appointments_today': tech.appointments_today.count()
-            })
+    available_list = [
+        {
+            'id': tech.id,
+            'name': tech.name,
+            'role': tech.role,
+            'current_workload': tech.workload_count,
+            'max_capacity': 3,
+            'appointments_today': tech.appointments_today_count
+        } for tech in available_techs
+    ]
     
     return Response({
         'message': f'Found {len(available_list)} available technicians',